@@ -3,10 +3,11 @@ import argparse
 
 from typing import Dict, Tuple
 
+from mailpy.connection import API_SESSION, API_TIMEOUT
 from mailpy.log import get_logger
 
 
-logger = get_logger()
+logger = get_logger(__name__)
 
 def register_arguments(parser: argparse.ArgumentParser):
     """Register command-line arguments for the delete command."""
@@ -60,7 +61,7 @@ def delete_user(
     
     logger.debug(f"Delete user payload: {payload}")
     try:
-        response = requests.delete(url, json=payload)
+        response = API_SESSION.delete(url, json=payload, timeout=API_TIMEOUT)
         if response.status_code != 200:
             logger.error(f"Deleting user failed with status code {response.status_code}: {response.json()}")
             return False, response.json()
@@ -11,9 +11,27 @@ from mailpy.log import get_logger
 from mailpy.config import get_mail_config, get_smtp_config, set_env_vars_from_args
 from mailpy.commands.read import read_emails, save_full_email
 from mailpy.commands.send import build_email_message, send_prepared_email, build_template_email_message
-from mailpy.mail_utils import save_to_sent_folder, extract_body_from_msg, expand_all_recipients
-
-logger = get_logger()
+from mailpy.mail_utils import save_to_sent_folder, extract_body_from_msg, expand_all_recipients, save_part_payload
+
+logger = get_logger(__name__)
+
+# Settings copied from the CLI arguments to the environment
+_ENV_KEYS = (
+    ("smtp_host", "SMTP_HOST"),
+    ("smtp_port", "SMTP_PORT"),
+    ("smtp_username", "SMTP_USERNAME"),
+    ("smtp_password", "SMTP_PASSWORD"),
+    ("smtp_security", "SMTP_SECURITY"),
+    ("allow_insecure_tls", "ALLOW_INSECURE_TLS"),
+    ("timeout", "TIMEOUT"),
+    # Read settings
+    ("mail_host", "MAIL_HOST"),
+    ("mail_port", "MAIL_PORT"),
+    ("mail_protocol", "MAIL_PROTOCOL"),
+    ("mail_username", "MAIL_USERNAME"),
+    ("mail_password", "MAIL_PASSWORD"),
+    ("mail_folder", "MAIL_FOLDER"),
+)
 
 
 def register_arguments(parser: argparse.ArgumentParser):
@@ -68,7 +86,7 @@ def register_arguments(parser: argparse.ArgumentParser):
 
     # Filtering
     parser.add_argument("--limit", type=int, default=-1, help="Number of emails to read (default: -1 (all)).")
-    parser.add_argument("--include-seen", action="store_true", help="Fetch seen and unseen emails (IMAP only). By default, only unseen emails are fetched.")
+    parser.add_argument("--include-seen", action="store_true", help="Fetch seen and unseen emails (IMAP only). By default, only unseen emails are fetched. Every fetched email is marked as seen, including those skipped by the regex filters.")
     parser.add_argument("--sort", choices=["oldest", "newest"], default="oldest", help="Sort order for fetching emails: oldest or newest first (default: oldest).")
     parser.add_argument("--date-since", help="Only fetch emails after YYYY-MM-DD [HH:MM[:SS]] or ISO format.")
     parser.add_argument("--date-before", help="Only fetch emails before YYYY-MM-DD [HH:MM[:SS]] or ISO format.")
@@ -128,12 +146,7 @@ def register_arguments(parser: argparse.ArgumentParser):
 def forward_email_cli(args: argparse.Namespace):
     """Entry point for the forward command."""
     # Set env vars
-    set_env_vars_from_args(args, [
-        "SMTP_HOST", "SMTP_PORT", "SMTP_USERNAME", "SMTP_PASSWORD",
-        "SMTP_SECURITY", "ALLOW_INSECURE_TLS", "TIMEOUT",
-        # Read settings
-        "MAIL_HOST", "MAIL_PORT", "MAIL_PROTOCOL", "MAIL_USERNAME", "MAIL_PASSWORD", "MAIL_FOLDER"
-    ])
+    set_env_vars_from_args(args, _ENV_KEYS)
     
     mail_config = get_mail_config()
     print(mail_config)
@@ -379,8 +392,7 @@ def forward_email(
                     if not filename:
                         continue
                     filepath = os.path.join(tempfile.gettempdir(), filename)
-                    with open(os.path.join(tempfile.gettempdir(), filename), "wb") as f:
-                        f.write(part.get_payload(decode=True))
+                    save_part_payload(part, filepath)
                     forwarded_attachments.append(filepath)
                     logger.info(f"Temporarily saved attachment: {filepath}")
                     # with tempfile.NamedTemporaryFile(delete=False, prefix="fwd_", suffix=f"_{filename}") as f:
@@ -3,10 +3,11 @@ import argparse
 
 from typing import Dict, Tuple
 
+from mailpy.connection import API_SESSION, API_TIMEOUT
 from mailpy.log import get_logger
 
 
-logger = get_logger()
+logger = get_logger(__name__)
 
 def register_arguments(parser: argparse.ArgumentParser):
     """Register command-line arguments for the passwd command."""
@@ -70,7 +71,7 @@ def change_password(
     
     logger.debug(f"Changing password payload: {payload}")
     try:
-        response = requests.put(url, json=payload)
+        response = API_SESSION.put(url, json=payload, timeout=API_TIMEOUT)
         if response.status_code != 200:
             logger.error(f"Changing password failed with status code {response.status_code}: {response.json()}")
             return False, response.json()
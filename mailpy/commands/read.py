@@ -11,19 +11,42 @@ import time
 import webbrowser
 import shlex
 
+from functools import lru_cache
 from mailbox import Message
 from typing import Any, Dict, List, Optional, Union, Tuple
 from datetime import datetime, timezone
 from email.utils import getaddresses
 from email import message_from_bytes
+from email.parser import BytesFeedParser
 
 from mailpy.log import get_logger
 from mailpy.config import get_mail_config, set_env_vars_from_args
 from mailpy.connection import connect_mail
-from mailpy.mail_utils import decode_mime_words, parse_datetime_flexible, extract_body_from_msg
+from mailpy.mail_utils import decode_mime_words, parse_datetime_flexible, extract_body_from_msg, save_part_payload
 
 
-logger = get_logger()
+logger = get_logger(__name__)
+
+# Settings copied from the CLI arguments to the environment
+_ENV_KEYS = (
+    ("mail_host", "MAIL_HOST"),
+    ("mail_port", "MAIL_PORT"),
+    ("mail_protocol", "MAIL_PROTOCOL"),
+    ("mail_username", "MAIL_USERNAME"),
+    ("mail_password", "MAIL_PASSWORD"),
+    ("mail_security", "MAIL_SECURITY"),
+    ("allow_insecure_tls", "ALLOW_INSECURE_TLS"),
+    ("timeout", "TIMEOUT"),
+)
+
+# http(s) links in a message body, a single greedy character class so it cannot backtrack
+_URL_RE = re.compile(r"https?://[^\s\"'<>]+")
+
+# Message ids per FETCH command, keeps the command line short with large selections
+_FETCH_BATCH_SIZE = 100
+
+# POP3 RETR lines joined per parser feed, bounds the size of each intermediate copy
+_POP3_FEED_LINES = 1000
 
 
 def register_arguments(parser: argparse.ArgumentParser):
@@ -40,7 +63,7 @@ def register_arguments(parser: argparse.ArgumentParser):
 
     # Filtering
     parser.add_argument("--limit", type=int, default=-1, help="Number of emails to read (default: -1 (all)).")
-    parser.add_argument("--include-seen", action="store_true", help="Fetch seen and unseen emails (IMAP only). By default, only unseen emails are fetched.")
+    parser.add_argument("--include-seen", action="store_true", help="Fetch seen and unseen emails (IMAP only). By default, only unseen emails are fetched. Every fetched email is marked as seen, including those skipped by the regex filters.")
     parser.add_argument("--sort", choices=["oldest", "newest"], default="oldest", help="Sort order for fetching emails: oldest or newest first (default: oldest).")
     parser.add_argument("--date-since", help="Only fetch emails after YYYY-MM-DD [HH:MM[:SS]] or ISO format.")
     parser.add_argument("--date-before", help="Only fetch emails before YYYY-MM-DD [HH:MM[:SS]] or ISO format.")
@@ -77,10 +100,7 @@ def read_email_cli(args: argparse.Namespace):
     """Read emails using CLI arguments."""
 
     # Set env vars from CLI args
-    set_env_vars_from_args(args, [
-        "MAIL_HOST", "MAIL_PORT", "MAIL_PROTOCOL", "MAIL_USERNAME",
-        "MAIL_PASSWORD", "MAIL_SECURITY", "ALLOW_INSECURE_TLS", "TIMEOUT"
-    ])
+    set_env_vars_from_args(args, _ENV_KEYS)
 
     mail_config = get_mail_config()
 
@@ -111,6 +131,23 @@ def read_email_cli(args: argparse.Namespace):
     return results
 
 
+_parse_from = lru_cache(maxsize=2048)(email.utils.parseaddr)
+
+
+def _sender_address(from_header) -> str:
+    """Return the address of a From header, cached as senders recur across a mailbox."""
+    if not isinstance(from_header, str):
+        # email.header.Header objects (raw 8-bit headers) are unhashable
+        return email.utils.parseaddr(from_header)[1]
+    return _parse_from(from_header)[1]
+
+
+@lru_cache(maxsize=32)
+def _compile_filter(pattern: str) -> re.Pattern:
+    """Compile a filter regex once per run."""
+    return re.compile(pattern, re.DOTALL | re.IGNORECASE)
+
+
 def filter_by_regex(subject: str, body: Union[str, List[Tuple[str, str]]], sender: str,
                     subject_re: Optional[str], body_re: Optional[str], from_re: Optional[str],
                     regex_mode: str = "any") -> bool:
@@ -120,23 +157,26 @@ def filter_by_regex(subject: str, body: Union[str, List[Tuple[str, str]]], sende
                 "all" => AND (message must match all provided regexes)
     If no regex provided, returns True.
     """
-    checks = []
-    if subject_re:
-        checks.append(bool(re.search(subject_re, subject or "", re.DOTALL | re.IGNORECASE)))
+    if not (subject_re or body_re or from_re):
+        return True
+    match_all = regex_mode == "all"
+
+    # Short subject/sender first, the body is only joined and searched if still undecided
+    for pattern, text in ((subject_re, subject), (from_re, sender)):
+        if pattern:
+            if bool(_compile_filter(pattern).search(text or "")) != match_all:
+                return not match_all
     if body_re:
         if isinstance(body, list):
-            body_text = " ".join([text.strip() for _, text in body])
-            checks.append(bool(re.search(body_re, body_text or "", re.DOTALL | re.IGNORECASE)))
-        else:
-            checks.append(bool(re.search(body_re, body or "", re.DOTALL | re.IGNORECASE)))
-    if from_re:
-        checks.append(bool(re.search(from_re, sender or "", re.DOTALL | re.IGNORECASE)))
+            body = " ".join([text.strip() for _, text in body])
+        return bool(_compile_filter(body_re).search(body or ""))
+    return match_all
 
-    if not checks:
-        return True
-    if regex_mode == "all":
-        return all(checks)
-    return any(checks)
+
+def headers_can_reject(subject_re: Optional[str], body_re: Optional[str], from_re: Optional[str],
+                       regex_mode: str, include_unmatched: bool) -> bool:
+    """Whether the Subject/From filters alone can skip a message, before its body is needed."""
+    return not include_unmatched and bool(subject_re or from_re) and (regex_mode == "all" or not body_re)
 
 
 def fetch_message_ids_pop3(
@@ -187,6 +227,18 @@ def fetch_message_ids_pop3(
     return ids
 
 
+def _parse_pop3_lines(lines: List[bytes]) -> Message:
+    """Parse the lines returned by POP3 RETR, feeding them to the parser in slices
+    instead of joining the whole message into a single bytes object first."""
+    parser = BytesFeedParser()
+    feed = parser.feed
+    for start in range(0, len(lines), _POP3_FEED_LINES):
+        if start:
+            feed(b"\r\n")
+        feed(b"\r\n".join(lines[start:start + _POP3_FEED_LINES]))
+    return parser.close()
+
+
 def select_messages_pop3(
     client: Union[poplib.POP3, poplib.POP3_SSL],
     limit: int,
@@ -209,21 +261,17 @@ def select_messages_pop3(
 
     since_dt = datetime.fromisoformat(date_since) if date_since else None
     before_dt = datetime.fromisoformat(date_before) if date_before else None
+    check_headers = headers_can_reject(subject_re, body_re, from_re, regex_mode, include_unmatched)
 
     for ref in msg_refs:
         idx, uid = ref["index"], ref["uid"]
         try:
             resp, lines, octets = client.retr(idx)
-            raw_msg = b"\r\n".join(lines)
-            msg = message_from_bytes(raw_msg)
-            body = extract_body_from_msg(msg)
+            msg = _parse_pop3_lines(lines)
 
             subject = decode_mime_words(msg.get("Subject", ""))
-            sender = email.utils.parseaddr(msg.get("From", ""))[1]
+            sender = _sender_address(msg.get("From", ""))
             date_str = msg.get("Date")
-            to_addrs = [addr for _, addr in getaddresses(msg.get_all("To", []))]
-            cc_addrs = [addr for _, addr in getaddresses(msg.get_all("Cc", []))]
-            reply_to_addrs = [addr for _, addr in getaddresses(msg.get_all("Reply-To", []))]
 
             # Date filtering
             if date_str and (since_dt or before_dt):
@@ -245,7 +293,16 @@ def select_messages_pop3(
                 except Exception as e:
                     logger.error(f"Failed to parse date '{date_str}' for message {uid}: {e}")
 
-            # Regex filtering
+            # Regex filtering, skip before decoding the body if the headers already fail
+            if check_headers and not filter_by_regex(subject, "", sender, subject_re, None, from_re, regex_mode):
+                logger.warning(f"Message {uid} skipped by regex filter")
+                continue
+
+            body = extract_body_from_msg(msg)
+            to_addrs = [addr for _, addr in getaddresses(msg.get_all("To", []))]
+            cc_addrs = [addr for _, addr in getaddresses(msg.get_all("Cc", []))]
+            reply_to_addrs = [addr for _, addr in getaddresses(msg.get_all("Reply-To", []))]
+
             matched = True
 
             if not filter_by_regex(subject, body, sender, subject_re, body_re, from_re, regex_mode):
@@ -257,6 +314,7 @@ def select_messages_pop3(
 
             results.append({
                 "id": uid,
+                "index": idx,
                 "raw_msg": msg,
                 "date": date_str,
                 "subject": subject,
@@ -343,6 +401,58 @@ def fetch_message_ids_imap(
     return ids
 
 
+def fetch_messages_imap(
+    client: Union[imaplib.IMAP4, imaplib.IMAP4_SSL],
+    ids: List[bytes],
+    query: str = "(RFC822)"
+) -> Dict[bytes, bytes]:
+    """
+    Fetch several messages with one FETCH command per batch of ids instead of one per message.
+    Returns a dict mapping each message id to the fetched data.
+    """
+    fetched: Dict[bytes, bytes] = {}
+    for start in range(0, len(ids), _FETCH_BATCH_SIZE):
+        batch = ids[start:start + _FETCH_BATCH_SIZE]
+        status, data = client.fetch(b",".join(batch), query)
+        if status != "OK":
+            logger.warning(f"Failed to fetch messages {b','.join(batch).decode()}")
+            continue
+        for item in data:
+            # Literal items are (b'<id> (RFC822 {<size>}', <data>), the rest are closing b')'
+            if isinstance(item, tuple):
+                fetched[item[0].split(b" ", 1)[0]] = item[1]
+    return fetched
+
+
+def prefilter_by_headers_imap(
+    client: Union[imaplib.IMAP4, imaplib.IMAP4_SSL],
+    ids: List[bytes],
+    subject_re: Optional[str],
+    from_re: Optional[str],
+    regex_mode: str
+) -> List[bytes]:
+    """
+    Drop the messages whose Subject/From already fail the regex filters, fetching only those
+    headers so skipped messages are never downloaded in full.
+    Like the full fetch, this sets \\Seen, so every candidate ends up seen whichever filter skips it.
+    """
+    headers_by_id = fetch_messages_imap(client, ids, "(BODY[HEADER.FIELDS (SUBJECT FROM)])")
+    kept = []
+    for mid in ids:
+        raw_headers = headers_by_id.get(mid)
+        if raw_headers is None:
+            kept.append(mid)  # Decide once the full message is fetched
+            continue
+        headers = message_from_bytes(raw_headers)
+        subject = decode_mime_words(headers.get("Subject", ""))
+        sender = _sender_address(headers.get("From", ""))
+        if filter_by_regex(subject, "", sender, subject_re, None, from_re, regex_mode):
+            kept.append(mid)
+        else:
+            logger.warning(f"Message {mid.decode()} skipped by regex filter")
+    return kept
+
+
 def select_messages_imap(
     client: Union[imaplib.IMAP4, imaplib.IMAP4_SSL],
     include_seen: bool,
@@ -373,18 +483,30 @@ def select_messages_imap(
     if not ids:
         return []
 
+    # Subject/From filters that alone decide a skip are checked on the headers first
+    check_headers = headers_can_reject(subject_re, body_re, from_re, regex_mode, include_unmatched)
+    if check_headers:
+        ids = prefilter_by_headers_imap(client, ids, subject_re, from_re, regex_mode)
+        if not ids:
+            return []
+
+    raw_by_id = fetch_messages_imap(client, ids)
     for mid in ids:
-        status, data = client.fetch(mid, "(RFC822)")
-        if status != "OK":
+        raw = raw_by_id.pop(mid, None)  # Free each raw buffer once parsed
+        if raw is None:
             logger.warning(f"Failed to fetch message {mid}")
             continue
-        raw = data[0][1]
         msg = message_from_bytes(raw)
         subject = decode_mime_words(msg.get("Subject", ""))
-        sender = email.utils.parseaddr(msg.get("From", ""))[1]
+        sender = _sender_address(msg.get("From", ""))
         date = msg.get("Date", "")
-        body = extract_body_from_msg(msg)
 
+        # Headers whose prefetch failed are checked here, before decoding the body
+        if check_headers and not filter_by_regex(subject, "", sender, subject_re, None, from_re, regex_mode):
+            logger.warning(f"Message {mid.decode()} skipped by regex filter")
+            continue
+
+        body = extract_body_from_msg(msg)
         to_addrs = [addr for _, addr in getaddresses(msg.get_all("To", []))]
         cc_addrs = [addr for _, addr in getaddresses(msg.get_all("Cc", []))]
         reply_to_addrs = [addr for _, addr in getaddresses(msg.get_all("Reply-To", []))]
@@ -534,23 +656,31 @@ def perform_actions_on_message(
     # Determine action to execute (for random mode choose one)
     chosen_actions = actions if action_mode == "all" or not actions else [random.choice(actions)]
 
+    # Attachments are decoded and saved once, then shared by download/exec/open
+    saved_attachments: Optional[List[str]] = None
+
     for act in chosen_actions:
         try:
             if act == "navigate":
                 links = click_links_in_body(body)
                 result["performed"].append({"navigated_links": links})
             elif act == "download-attachments":
-                saved = download_attachment(msg, download_dir)
-                result["performed"].append({"downloaded": saved})
+                if saved_attachments is None:
+                    saved_attachments = download_attachment(msg, download_dir)
+                result["performed"].append({"downloaded": saved_attachments})
             elif act == "download-mail":
                 path = save_full_email(msg, download_dir, subject)
                 result["performed"].append({"saved_mail": path})
             elif act == "exec":
-                saved = download_attachment(msg, download_dir)
+                if saved_attachments is None:
+                    saved_attachments = download_attachment(msg, download_dir)
+                saved = saved_attachments
                 execute_files(saved, cwd, exec_cmd)
                 result["performed"].append({"executed": saved})
             elif act == "open":
-                saved = download_attachment(msg, download_dir)
+                if saved_attachments is None:
+                    saved_attachments = download_attachment(msg, download_dir)
+                saved = saved_attachments
                 open_files(saved, cwd, open_cmd)
                 result["performed"].append({"opened": saved})
             else:
@@ -585,13 +715,13 @@ def download_attachment(msg: Message, download_dir: str) -> List[str]:
         if part.get_content_maintype() == "multipart":
             continue
         dispo = part.get_content_disposition()
-        if dispo == "attachment" or part.get_filename():
-            filename = part.get_filename() or f"attachment_{int(time.time())}"
+        filename = part.get_filename()
+        if dispo == "attachment" or filename:
+            filename = filename or f"attachment_{int(time.time())}"
             filename = os.path.basename(filename)
             path = os.path.join(download_dir, filename)
             try:
-                with open(path, "wb") as f:
-                    f.write(part.get_payload(decode=True))
+                save_part_payload(part, path)
                 logger.info(f"Attachment downloaded: {path}")
                 saved.append(path)
             except Exception as e:
@@ -604,7 +734,7 @@ def click_links_in_body(body: Union[str, List[Tuple[str, str]]]) -> List[str]:
     if isinstance(body, list):
         body = " ".join([text.strip() for _, text in body])
     
-    links = re.findall(r"https?://[^\s\"'<>]+", body)
+    links = _URL_RE.findall(body)
     links_list = []
     if not links:
         logger.info("No links found in message body.")
@@ -639,14 +769,15 @@ def save_full_email(msg: Message, download_dir: str, subject: str) -> str:
 
 def execute_files(filepaths: List[str], cwd: Optional[str] = None, exec_cmd: str = "auto"):
     """Run each file in list as a subprocess (be cautious)."""
+    # Same working directory and environment for every file
+    execute_path = os.path.abspath(os.path.expanduser(cwd)) if cwd else None
+    env = os.environ.copy()
+
     for p in filepaths:
         p = os.path.abspath(p)
         try:
-            if cwd:
-                execute_path = os.path.abspath(os.path.expanduser(cwd))
+            if execute_path:
                 logger.info(f"Executing in specified cwd: {execute_path}.")
-            else:
-                execute_path = None
 
             if exec_cmd == "auto":
                 cmd = shlex.quote(p)
@@ -661,7 +792,7 @@ def execute_files(filepaths: List[str], cwd: Optional[str] = None, exec_cmd: str
             proc = subprocess.Popen(
                 ["/bin/bash", "-c", cmd],
                 cwd=execute_path,
-                env=os.environ.copy(),
+                env=env,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 start_new_session=True
@@ -673,13 +804,14 @@ def execute_files(filepaths: List[str], cwd: Optional[str] = None, exec_cmd: str
 
 def open_files(filepaths: List[str], cwd: Optional[str] = None, open_cmd: str = "auto"):
     """Open files with default OS application (xdg-open on Linux) or custom command."""
+    # Same working directory and environment for every file
+    execute_path = os.path.abspath(os.path.expanduser(cwd)) if cwd else None
+    env = os.environ.copy()
+
     for p in filepaths:
         p = os.path.abspath(p)
-        if cwd:
-            execute_path = os.path.abspath(os.path.expanduser(cwd))
+        if execute_path:
             logger.info(f"Executing open in specified cwd: {execute_path}.")
-        else:
-            execute_path = None
         
         try:
             if open_cmd == "auto":
@@ -688,7 +820,7 @@ def open_files(filepaths: List[str], cwd: Optional[str] = None, open_cmd: str =
                     subprocess.Popen(
                         ["xdg-open", p], 
                         cwd=execute_path, 
-                        env=os.environ.copy()
+                        env=env
                     )
                 elif sys.platform == "darwin":
                     subprocess.Popen(["open", p])
@@ -700,12 +832,48 @@ def open_files(filepaths: List[str], cwd: Optional[str] = None, open_cmd: str =
                 subprocess.Popen(
                     [open_cmd, p],
                     cwd=execute_path,
-                    env=os.environ.copy()
+                    env=env
                 )
         except Exception as e:
             logger.error(f"Failed to open {p} with default program: {e}.")
 
 
+def delete_messages_pop3(client: Union[poplib.POP3, poplib.POP3_SSL], indexes: List[int]):
+    """
+    Mark POP3 messages for deletion (applied on QUIT).
+    When the server announces PIPELINING (RFC 2449) all the DELE commands are sent
+    before reading their responses, instead of one round trip per message.
+    """
+    if not indexes:
+        return
+
+    try:
+        pipelining = "PIPELINING" in client.capa()
+    except poplib.error_proto:
+        pipelining = False  # No CAPA support
+
+    if not pipelining:
+        for index in indexes:
+            try:
+                client.dele(index)
+                logger.info(f"Deleted POP3 message index {index}")
+            except Exception as e:
+                logger.error(f"Failed to delete POP3 message {index}: {e}")
+        return
+
+    try:
+        for index in indexes:
+            client._putcmd(f"DELE {index}")
+        for index in indexes:
+            try:
+                client._getresp()
+                logger.info(f"Deleted POP3 message index {index}")
+            except poplib.error_proto as e:
+                logger.error(f"Failed to delete POP3 message {index}: {e}")
+    except Exception as e:
+        logger.error(f"Failed to delete POP3 messages: {e}")
+
+
 def read_emails(
     mail_config: Dict[str, Any],
     limit: int = -1,
@@ -796,13 +964,9 @@ def read_emails(
 
         results_all.append({**record, "actions": action_result.get("performed")})
 
-        # POP3 deletion if requested
-        if protocol == "pop3" and pop3_delete:
-            try:
-                client.dele(int(record["id"]) + 1)
-                logger.info(f"Deleted POP3 message index {record['id']}")
-            except Exception as e:
-                logger.error(f"Failed to delete POP3 message {record['id']}: {e}")
+    # POP3 deletion if requested, all the DELE commands sent together
+    if protocol == "pop3" and pop3_delete:
+        delete_messages_pop3(client, [record["index"] for record in selected])
 
     # Cleanup and logout
     try:
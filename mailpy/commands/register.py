@@ -3,10 +3,11 @@ import argparse
 
 from typing import Optional, Dict, Tuple
 
+from mailpy.connection import API_SESSION, API_TIMEOUT
 from mailpy.log import get_logger
 
 
-logger = get_logger()
+logger = get_logger(__name__)
 
 def register_arguments(parser: argparse.ArgumentParser):
     """Register command-line arguments for the register command."""
@@ -81,7 +82,7 @@ def register_user(
     
     logger.debug(f"Registration payload: {payload}")
     try:
-        response = requests.post(url, json=payload)
+        response = API_SESSION.post(url, json=payload, timeout=API_TIMEOUT)
         if response.status_code != 201:
             logger.error(f"Registration failed with status code {response.status_code}: {response.json()}")
             return False, response.json()
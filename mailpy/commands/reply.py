@@ -14,7 +14,25 @@ from mailpy.commands.send import build_email_message, send_prepared_email, build
 from mailpy.mail_utils import extract_body_from_msg, expand_all_recipients
 
 
-logger = get_logger()
+logger = get_logger(__name__)
+
+# Settings copied from the CLI arguments to the environment
+_ENV_KEYS = (
+    ("smtp_host", "SMTP_HOST"),
+    ("smtp_port", "SMTP_PORT"),
+    ("smtp_username", "SMTP_USERNAME"),
+    ("smtp_password", "SMTP_PASSWORD"),
+    ("smtp_security", "SMTP_SECURITY"),
+    ("allow_insecure_tls", "ALLOW_INSECURE_TLS"),
+    ("timeout", "TIMEOUT"),
+    # Read settings
+    ("mail_host", "MAIL_HOST"),
+    ("mail_port", "MAIL_PORT"),
+    ("mail_protocol", "MAIL_PROTOCOL"),
+    ("mail_username", "MAIL_USERNAME"),
+    ("mail_password", "MAIL_PASSWORD"),
+    ("mail_folder", "MAIL_FOLDER"),
+)
 
 
 def register_arguments(parser: argparse.ArgumentParser):
@@ -71,7 +89,7 @@ def register_arguments(parser: argparse.ArgumentParser):
 
     # Filtering
     parser.add_argument("--limit", type=int, default=-1, help="Number of emails to read (default: -1 (all)).")
-    parser.add_argument("--include-seen", action="store_true", help="Fetch seen and unseen emails (IMAP only). By default, only unseen emails are fetched.")
+    parser.add_argument("--include-seen", action="store_true", help="Fetch seen and unseen emails (IMAP only). By default, only unseen emails are fetched. Every fetched email is marked as seen, including those skipped by the regex filters.")
     parser.add_argument("--sort", choices=["oldest", "newest"], default="oldest", help="Sort order for fetching emails: oldest or newest first (default: oldest).")
     parser.add_argument("--date-since", help="Only fetch emails after YYYY-MM-DD [HH:MM[:SS]] or ISO format.")
     parser.add_argument("--date-before", help="Only fetch emails before YYYY-MM-DD [HH:MM[:SS]] or ISO format.")
@@ -116,12 +134,7 @@ def register_arguments(parser: argparse.ArgumentParser):
 
 def reply_email_cli(args: argparse.Namespace):
     """Entry point for the reply command."""
-    set_env_vars_from_args(args, [
-        "SMTP_HOST", "SMTP_PORT", "SMTP_USERNAME", "SMTP_PASSWORD",
-        "SMTP_SECURITY", "ALLOW_INSECURE_TLS", "TIMEOUT",
-        # Read settings
-        "MAIL_HOST", "MAIL_PORT", "MAIL_PROTOCOL", "MAIL_USERNAME", "MAIL_PASSWORD", "MAIL_FOLDER"
-    ])
+    set_env_vars_from_args(args, _ENV_KEYS)
 
     mail_config = get_mail_config()
 
@@ -1,10 +1,12 @@
 import argparse
+import imaplib
 import json
 import os
 import mimetypes
 import smtplib
 
 # from contextlib import redirect_stdout
+from contextlib import nullcontext
 from typing import List, Optional, Dict, Any, Tuple, Union
 from email import encoders, message_from_binary_file
 from email.utils import encode_rfc2231, formatdate, make_msgid
@@ -18,11 +20,29 @@ from email.mime.message import MIMEMessage
 from mailpy.email_templates import get_template
 from mailpy.log import get_logger
 from mailpy.config import get_smtp_config, set_env_vars_from_args
-from mailpy.connection import connect_smtp, connect_mail
-from mailpy.mail_utils import save_to_sent_folder, expand_all_recipients
-
-
-logger = get_logger()
+from mailpy.connection import connect_smtp, connect_imap_keepalive
+from mailpy.mail_utils import save_to_sent_folder, expand_all_recipients, batch_append
+
+
+logger = get_logger(__name__)
+
+# Settings copied from the CLI arguments to the environment
+_ENV_KEYS = (
+    ("smtp_host", "SMTP_HOST"),
+    ("smtp_port", "SMTP_PORT"),
+    ("smtp_username", "SMTP_USERNAME"),
+    ("smtp_password", "SMTP_PASSWORD"),
+    ("smtp_security", "SMTP_SECURITY"),
+    ("allow_insecure_tls", "ALLOW_INSECURE_TLS"),
+    ("timeout", "TIMEOUT"),
+    # IMAP settings for saving sent emails
+    ("mail_host", "MAIL_HOST"),
+    ("mail_port", "MAIL_PORT"),
+    ("mail_username", "MAIL_USERNAME"),
+    ("mail_password", "MAIL_PASSWORD"),
+    ("mail_security", "MAIL_SECURITY"),
+    ("mail_folder", "MAIL_FOLDER"),
+)
 
 
 def register_arguments(parser: argparse.ArgumentParser):
@@ -77,13 +97,7 @@ def send_email_cli(args: argparse.Namespace):
     """Send an email using SMTP through CLI arguments."""
     
     # Set env vars from CLI args
-    set_env_vars_from_args(args, [
-        "SMTP_HOST", "SMTP_PORT", "SMTP_USERNAME", "SMTP_PASSWORD",
-        "SMTP_SECURITY", "ALLOW_INSECURE_TLS", "TIMEOUT",
-        # IMAP settings for saving sent emails
-        "MAIL_HOST", "MAIL_PORT", "MAIL_USERNAME", "MAIL_PASSWORD", 
-        "MAIL_SECURITY", "MAIL_FOLDER"
-    ])
+    set_env_vars_from_args(args, _ENV_KEYS)
 
     smtp_config = get_smtp_config(include_imap=args.save_sent)
 
@@ -116,36 +130,49 @@ def send_email_cli(args: argparse.Namespace):
 
     # Send separately if requested
     if args.send_separately:
-        for recipient in args.destination:
-            # Build message for each recipient
-            msg = build_email_message(
-                sender=args.sender,
-                destination=[recipient],
-                subject=args.subject,
-                body=args.body,
-                body_file=args.body_file,
-                body_images=args.body_image,
-                attachments=args.attach,
-                cc=args.cc,
-                template_name=args.template,
-                template_params=args.template_params
-            )
-
-            # Prepare recipients list
-            all_recipients = [recipient]
-            if args.cc:
-                all_recipients.extend(args.cc)
-            if args.bcc:
-                all_recipients.extend(args.bcc)
-
-            # Send email
-            send_prepared_email(
-                msg=msg,
-                smtp_config=smtp_config,
-                sender=args.sender,
-                all_recipients=all_recipients,
-                save_sent=args.save_sent
-            )
+        imap_client = None
+        batch = nullcontext()
+        if args.save_sent:
+            # One IMAP connection for all the copies, appended together to the Sent folder
+            imap_config = smtp_config["imap_config"]
+            try:
+                imap_client = connect_imap_keepalive(imap_config)
+                batch = batch_append(imap_client, imap_config.get("folder", "Sent"))
+            except Exception as e:
+                logger.error(f"Failed to connect to IMAP to save sent emails: {e}")
+
+        with batch:
+            for recipient in args.destination:
+                # Build message for each recipient
+                msg = build_email_message(
+                    sender=args.sender,
+                    destination=[recipient],
+                    subject=args.subject,
+                    body=args.body,
+                    body_file=args.body_file,
+                    body_images=args.body_image,
+                    attachments=args.attach,
+                    cc=args.cc,
+                    template_name=args.template,
+                    template_params=args.template_params
+                )
+
+                # Prepare recipients list
+                all_recipients = [recipient]
+                if args.cc:
+                    all_recipients.extend(args.cc)
+                if args.bcc:
+                    all_recipients.extend(args.bcc)
+
+                # Send email
+                send_prepared_email(
+                    msg=msg,
+                    smtp_config=smtp_config,
+                    sender=args.sender,
+                    all_recipients=all_recipients,
+                    save_sent=args.save_sent,
+                    imap_client=imap_client
+                )
         return
 
     # Build message
@@ -374,9 +401,13 @@ def send_prepared_email(
     smtp_config: Dict[str, Any],
     sender: str,
     all_recipients: List[str],
-    save_sent: bool = False
+    save_sent: bool = False,
+    imap_client: Optional[imaplib.IMAP4] = None
 ) -> bool:
-    """Send a pre-built email and optionally save it to the 'Sent' folder."""
+    """Send a pre-built email and optionally save it to the 'Sent' folder.
+    If `imap_client` is given it is used to save the email, otherwise the IMAP session
+    is kept open and reused by later calls.
+    """
     try:
         with connect_smtp(smtp_config) as server:
             server.send_message(msg, from_addr=sender, to_addrs=all_recipients)
@@ -384,11 +415,13 @@ def send_prepared_email(
 
         if save_sent:
             imap_config = smtp_config["imap_config"]
-            imap_client, _ = connect_mail(imap_config)
+            if imap_client is None:
+                imap_client = connect_imap_keepalive(imap_config)
             save_to_sent_folder(
                 imap_client=imap_client,
                 sent_folder=imap_config.get("folder", "Sent"),
-                msg_bytes=msg.as_bytes()
+                msg_bytes=msg.as_bytes(),
+                msg=msg
             )
         return True
     except smtplib.SMTPAuthenticationError as e:
@@ -545,11 +578,12 @@ def send_email(
 
         if save_sent:
             imap_config = smtp_config["imap_config"]
-            imap_client, _ = connect_mail(imap_config)
+            imap_client = connect_imap_keepalive(imap_config)
             save_to_sent_folder(
                 imap_client=imap_client,
                 sent_folder=imap_config.get("folder", "Sent"),
-                msg_bytes=msg.as_bytes()
+                msg_bytes=msg.as_bytes(),
+                msg=msg
             )
         return True
     except Exception as e:
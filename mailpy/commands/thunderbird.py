@@ -9,7 +9,7 @@ from typing import List, Optional
 
 from mailpy.log import get_logger
 
-logger = get_logger()
+logger = get_logger(__name__)
 
 
 # Globals
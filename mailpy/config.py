@@ -5,20 +5,25 @@ from typing import Any, Dict
 
 def load_env_file(file_path: str = ".env"):
     """Load environment variables from .env file."""
-    if os.path.exists(file_path):
-        with open(file_path, "r") as f:
-            for line in f:
-                if line.strip() and not line.startswith("#"):
-                    key, value = line.strip().split("=", 1)
-                    os.environ[key] = value
+    if not os.path.exists(file_path):
+        return
+    with open(file_path, "r") as f:
+        data = f.read()
 
+    for line in data.splitlines():
+        line = line.strip()
+        if line and line[0] != "#":
+            key, sep, value = line.partition("=")
+            if sep:
+                os.environ[key] = value
 
-def set_env_vars_from_args(args, keys):
-    """Set environment variables from argparse arguments."""
-    for key in keys:
-        value = getattr(args, key.lower(), None)
+
+def set_env_vars_from_args(args, env_map):
+    """Set environment variables from (argparse attribute, variable) pairs."""
+    for attr, env in env_map:
+        value = getattr(args, attr, None)
         if value is not None:
-            os.environ[key.upper()] = str(value)
+            os.environ[env] = str(value)
 
 
 def get_smtp_config(include_imap: bool = False) -> Dict[str, Any]:
@@ -1,16 +1,28 @@
+import atexit
 import ssl
 import smtplib
 import imaplib
 import poplib
 import socket
+import requests
 
 from typing import Any, Dict, Tuple, Union
+from requests.adapters import HTTPAdapter
 
 from mailpy.log import get_logger
 # from mailclient.log import get_logger
 
 
-logger = get_logger()
+logger = get_logger(__name__)
+
+# Keep-alive session shared by the calls to the mail server user API
+API_SESSION = requests.Session()
+API_SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+API_TIMEOUT = 30
+
+# Authenticated IMAP sessions kept open across calls, keyed by (host, port, username)
+_KEEPALIVE_IMAP: Dict[Tuple[str, int, str], Union[imaplib.IMAP4, imaplib.IMAP4_SSL]] = {}
+_keepalive_exit_registered = False
 
 
 def create_ssl_context(allow_insecure: bool = False) -> ssl.SSLContext:
@@ -74,3 +86,44 @@ def connect_mail(config: Dict[str, Any]) -> Tuple[Union[imaplib.IMAP4, imaplib.I
 
     else:
         raise ValueError(f"Unsupported protocol: {config['protocol']}")
+
+
+def _register_keepalive_exit():
+    """Log out of the kept sessions at exit.
+    Registered on first use, after setup_global_logger, so it runs before the
+    log listener is stopped (atexit handlers run in reverse order).
+    """
+    global _keepalive_exit_registered
+    atexit.register(close_keepalive_connections)
+    _keepalive_exit_registered = True
+
+
+def connect_imap_keepalive(config: Dict[str, Any]) -> Union[imaplib.IMAP4, imaplib.IMAP4_SSL]:
+    """Return a connected IMAP client reused across calls with the same server and user.
+    The session is probed with NOOP and reconnected only if it dropped.
+    """
+    key = (config["host"], config["port"], config["username"])
+    client = _KEEPALIVE_IMAP.get(key)
+    if client is not None:
+        try:
+            if client.noop()[0] == "OK":
+                return client
+        except Exception as e:
+            logger.warning(f"IMAP session to {config['host']}:{config['port']} dropped, reconnecting: {e}")
+        del _KEEPALIVE_IMAP[key]
+
+    client, _ = connect_mail({**config, "protocol": "imap"})
+    if not _keepalive_exit_registered:
+        _register_keepalive_exit()
+    _KEEPALIVE_IMAP[key] = client
+    return client
+
+
+def close_keepalive_connections():
+    """Log out of the IMAP sessions opened by connect_imap_keepalive."""
+    while _KEEPALIVE_IMAP:
+        _, client = _KEEPALIVE_IMAP.popitem()
+        try:
+            client.logout()
+        except Exception as e:
+            logger.warning(f"Failed to log out of IMAP session: {e}")
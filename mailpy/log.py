@@ -1,30 +1,87 @@
 import os
+import sys
+import atexit
 import logging
-import inspect
+import queue
+import time
 
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from typing import Optional
 
 
 LOG_DIR = os.path.join(os.path.expanduser("~"), ".config", "mailclient")
 LOG_PATH = os.path.join(LOG_DIR, "mailclient.log")
-os.makedirs(LOG_DIR, exist_ok=True)
+
+# Background listener writing the queued records, kept alive for the whole process
+_listener: Optional[QueueListener] = None
 
 
 class LevelBasedFormatter(logging.Formatter):
     """Custom formatter that changes format based on log level."""
+    def __init__(self):
+        super().__init__()
+        self._info_formatter = logging.Formatter("%(message)s")
+        self._default_formatter = logging.Formatter("[%(levelname)s] %(message)s")
+
     def format(self, record):
         if record.levelno == logging.INFO:
-            fmt = "%(message)s"
-        else:
-            fmt = "[%(levelname)s] %(message)s"
-        return logging.Formatter(fmt).format(record)
+            return self._info_formatter.format(record)
+        return self._default_formatter.format(record)
     
 
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs strftime for %(asctime)s only once per second."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, "")  # (second, formatted time)
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = time.strftime(self.default_time_format, self.converter(second))
+            self._cached_time = (second, formatted)
+        return self.default_msec_format % (formatted, record.msecs)
+
+
+class CountingRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that checks the size through the stream position.
+    The stream is opened in append mode, so after each write its position is
+    the end of the file, including lines appended by other mailpy processes.
+    No stat calls are made per record, and each record is formatted once for
+    both the size check and the write.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # See bpo-45401: never roll over anything other than regular files (checked once)
+        self._regular_file = not os.path.exists(self.baseFilename) or os.path.isfile(self.baseFilename)
+        self._last_record = None
+        self._last_text = ""
+
+    def format(self, record):
+        if record is not self._last_record:
+            self._last_record, self._last_text = record, super().format(record)
+        return self._last_text
+
+    def shouldRollover(self, record):
+        if self.maxBytes <= 0 or not self._regular_file:
+            return False
+        if self.stream is None:  # delay was set...
+            self.stream = self._open()
+        size = len(self.format(record).encode(self.encoding or "utf-8")) + 1
+        return self.stream.tell() + size >= self.maxBytes
+
+
 def setup_global_logger(debug: bool = False):
     """Setup the global logger with file and console handlers.
     All modules use this configuration.
+    Records are queued and written by a background thread, so logging calls
+    do not block on disk or console I/O.
     """
+    global _listener
+
     root_logger = logging.getLogger()
     if root_logger.handlers:
         return
@@ -32,12 +89,12 @@ def setup_global_logger(debug: bool = False):
     root_logger.setLevel(logging.DEBUG)
 
     # File handler
-    file_handler = RotatingFileHandler(LOG_PATH, maxBytes=1024 * 1024, backupCount=3)
-    file_formatter = logging.Formatter(
+    os.makedirs(LOG_DIR, exist_ok=True)
+    file_handler = CountingRotatingFileHandler(LOG_PATH, maxBytes=1024 * 1024, backupCount=3)
+    file_formatter = CachedTimeFormatter(
         "%(asctime)s [PID %(process)d] [%(name)s] [%(funcName)s] [%(levelname)s] %(message)s"
     )
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
 
     # Console handler
     console_handler = logging.StreamHandler()
@@ -49,21 +106,27 @@ def setup_global_logger(debug: bool = False):
         console_handler.setLevel(logging.INFO)
 
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+
+    # Queue handler on the root logger, the listener dispatches to the real handlers
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)  # Flush pending records on exit
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Return a configured logger for the given module name.
     All loggers share the same configuration.
+    Modules should pass __name__; when omitted, the caller's module is used.
     """
     if name is None:
-        frame = inspect.stack()[1]
-        module = inspect.getmodule(frame[0])
-        if module and module.__name__ != "__main__":
-            name = module.__name__
-        else:
-            name = os.path.splitext(os.path.basename(frame.filename))[0]
-    return logging.getLogger(name)
+        # Only the caller's frame is needed, avoid building the whole stack
+        frame = sys._getframe(1)
+        name = frame.f_globals.get("__name__")
+        if not name or name == "__main__":
+            name = os.path.splitext(os.path.basename(frame.f_code.co_filename))[0]
+    return logging.getLogger(sys.intern(name))
 
 
 # def get_logger(name: Optional[str] = None, debug: bool = True) -> logging.Logger:
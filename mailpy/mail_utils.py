@@ -1,101 +1,270 @@
+import asyncio
+import binascii
+import codecs
 import imaplib
 import re
+import threading
 import time
-import requests
+import weakref
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Tuple
-from email import message_from_bytes
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Dict, Iterator, List, Optional, Union, Tuple
 from email.message import Message
+from email.parser import BytesHeaderParser
 from email.utils import parsedate_tz, mktime_tz
 from email.header import decode_header
 
+from mailpy.connection import API_SESSION, API_TIMEOUT
 from mailpy.log import get_logger
 
+try:
+    import httpx
+except ImportError:  # Optional, address expansion falls back to threads
+    httpx = None
+
+
+logger = get_logger(__name__)
+
+
+@lru_cache(maxsize=16)
+def _get_decoder(encoding: str):
+    """Return the decode function of a codec, caching the codec registry lookup."""
+    return codecs.lookup(encoding).decode
+
+
+def _decode_header_bytes(part: bytes, enc: Optional[str], value: str) -> str:
+    """Decode one bytes chunk returned by decode_header, falling back to utf-8 for unknown charsets."""
+    # return part.decode(enc or "utf-8", errors="ignore")
+    if not enc or enc.lower() in ("unknown-8bit", "x-unknown"):
+        logger.debug(f"Header with unknown 8-bit encoding detected: {value}")
+        enc = "utf-8"
+
+    try:
+        decode = _get_decoder(enc)
+    except LookupError:
+        logger.debug(f"Unknown codec '{enc}' in header, falling back to utf-8: {value}")
+        decode = _get_decoder("utf-8")
+    return decode(part, "replace")[0]
+
+
+@lru_cache(maxsize=4096)
+def _decode_encoded_words(value: str) -> str:
+    """Decode the encoded-words of a header value, cached as subjects and senders recur across a mailbox."""
+    parts = decode_header(value)
+    if len(parts) == 1:
+        # Single chunk, the usual case, no need to join
+        part, enc = parts[0]
+        return part if isinstance(part, str) else _decode_header_bytes(part, enc, value)
+
+    return "".join(
+        part if isinstance(part, str) else _decode_header_bytes(part, enc, value)
+        for part, enc in parts
+    )
 
-logger = get_logger()
 
 def decode_mime_words(value: str) -> str:
     """Decode MIME encoded-words (e.g. =?utf-8?q?...?=) and tolerate malformed 8-bit headers."""
     if not value:
         return ""
-    
-    decoded_parts = []
-
-    for part, enc in decode_header(value):
-        if isinstance(part, bytes):
-            # decoded_parts.append(part.decode(enc or "utf-8", errors="ignore"))
-            if not enc or enc.lower() in ("unknown-8bit", "x-unknown"):
-                logger.debug(f"Header with unknown 8-bit encoding detected: {value}")
-                enc = "utf-8"
-            
-            try:
-                decoded_parts.append(part.decode(enc, errors="replace"))
-            except LookupError:
-                logger.debug(f"Unknown codec '{enc}' in header, falling back to utf-8: {value}")
-                decoded_parts.append(part.decode("utf-8", errors="replace"))
-        else:
-            decoded_parts.append(part)
-    
-    return "".join(decoded_parts)
+    if not isinstance(value, str):
+        # email.header.Header objects (raw 8-bit headers) are unhashable, decode them uncached
+        return _decode_encoded_words.__wrapped__(value)
+    if "=?" not in value:
+        # No encoded-words, decode_header would return the value unchanged
+        return value
+    return _decode_encoded_words(value)
+
+
+# IMAP LIST response line: (<flags>) "<delimiter>"|NIL <name>, name optionally quoted
+_LIST_RE = re.compile(
+    rb'^\((?P<flags>[^)]*)\)\s+(?:"(?P<delim>[^"]*)"|NIL)\s+"?(?P<name>.*?)"?$',
+    re.ASCII
+)
+
+# Parsed LIST responses keyed by a digest of the raw response, shared by all clients
+_LIST_PARSE_CACHE: Dict[bytes, List[Dict[str, str]]] = {}
+_LIST_PARSE_CACHE_SIZE = 8
+
+# Parsed LIST responses per IMAP client, dropped when the client is garbage collected
+_FOLDER_CACHE: "weakref.WeakKeyDictionary[imaplib.IMAP4, List[Dict[str, str]]]" = weakref.WeakKeyDictionary()
+
+
+def _parse_list_response(folders: List[Union[bytes, Tuple[bytes, bytes]]]) -> List[Dict[str, str]]:
+    """Parse the lines of an IMAP LIST response."""
+    parsed = []
+    append = parsed.append
+    match = _LIST_RE.match
+    for f in folders:
+        if not f:
+            continue  # Trailer after a literal (b'') or empty response (None)
+        if isinstance(f, tuple):
+            # Name sent as a literal: (b'(<flags>) "<delim>" {<size>}', b'<name>')
+            f = f[0][:f[0].rfind(b"{")] + b'"' + f[1] + b'"'
+        m = match(f)
+        if m is None:
+            logger.warning(f"Unexpected LIST response line: {f!r}")
+            continue
+
+        # Get flags, delimiter, and name, kept as bytes until the final decode
+        delimiter = m["delim"]
+        append({
+            "flags": [flag.lstrip(b"\\").decode() for flag in m["flags"].split()],  # Remove leading backslash
+            "delimiter": delimiter.decode() if delimiter is not None else "",
+            "name": m["name"].decode()
+        })
+    return parsed
 
 
 def list_mailboxes(client: Union[imaplib.IMAP4, imaplib.IMAP4_SSL]) -> List[Dict[str, str]]:
-    """Parse IMAP LIST response to a structured format."""
+    """Parse IMAP LIST response to a structured format.
+    The result is cached per client, so LIST is only issued once per connection,
+    and identical LIST responses (e.g. several clients on the same server) are parsed once.
+    """
+    cached = _FOLDER_CACHE.get(client)
+    if cached is not None:
+        return cached
+
     status, folders = client.list()
     if status != 'OK':
         logger.error("Failed to list mailboxes")
         return []
-    
-    parsed = []
+
+    digest = blake2b(digest_size=8)
     for f in folders:
-        line = f.decode()
-
-        # Get flags, delimiter, and name
-        parts = line.split(' ')
-        flags = parts[0].strip('()')
-        delimiter = parts[-2].strip('"')
-        name = parts[-1].strip('"')
-        parsed.append({
-            "flags": flags.split('\\')[1:],  # Split flags and remove leading backslash
-            "delimiter": delimiter,
-            "name": name
-        })
+        for chunk in (f if isinstance(f, tuple) else (f,)):
+            digest.update(chunk or b"")
+            digest.update(b"\0")
+    key = digest.digest()
+
+    parsed = _LIST_PARSE_CACHE.get(key)
+    if parsed is None:
+        parsed = _parse_list_response(folders)
+        if len(_LIST_PARSE_CACHE) >= _LIST_PARSE_CACHE_SIZE:
+            del _LIST_PARSE_CACHE[next(iter(_LIST_PARSE_CACHE))]  # Evict the oldest entry
+        _LIST_PARSE_CACHE[key] = parsed
+
+    _FOLDER_CACHE[client] = parsed
     return parsed
 
 
+# Bound once, used on every save to the Sent folder
+_time2internaldate = imaplib.Time2Internaldate
+_parsedate_tz = parsedate_tz
+_mktime_tz = mktime_tz
+_time_now = time.time
+
+# (second, INTERNALDATE) of the last "now" date built, reused within the same second
+_cached_now_internaldate: Tuple[int, str] = (0, "")
+
+
+def _now_internaldate() -> str:
+    """Return the current time as an IMAP INTERNALDATE string, rebuilt at most once per second."""
+    global _cached_now_internaldate
+    now = int(_time_now())
+    if now != _cached_now_internaldate[0]:
+        _cached_now_internaldate = (now, _time2internaldate(now))
+    return _cached_now_internaldate[1]
+
+
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _internaldate_from_header(date_header: str) -> str:
+    """Build an IMAP INTERNALDATE string from a Date header, keeping the header's own timezone."""
+    time_tuple = _parsedate_tz(date_header)
+    if time_tuple is None:
+        raise ValueError(f"Invalid Date header: {date_header}")
+
+    offset = time_tuple[9]
+    if offset is None:
+        # No timezone in the header, interpret it as local time
+        return _time2internaldate(_mktime_tz(time_tuple))
+
+    year, month, day, hour, minute, second = time_tuple[:6]
+    try:
+        datetime(year, month, day, hour, minute, second)
+    except ValueError:
+        # parsedate_tz does not range-check, let mktime_tz normalise out-of-range fields
+        return _time2internaldate(_mktime_tz(time_tuple))
+    sign = "+" if offset >= 0 else "-"
+    offset_hours, offset_minutes = divmod(abs(offset) // 60, 60)
+    return (
+        f'"{day:02d}-{_MONTHS[month - 1]}-{year:04d} {hour:02d}:{minute:02d}:{second:02d} '
+        f'{sign}{offset_hours:02d}{offset_minutes:02d}"'
+    )
+
+
+_DATE_HEADER_RE = re.compile(rb"^Date:[ \t]*(.*(?:\r?\n[ \t].*)*)", re.IGNORECASE | re.MULTILINE | re.ASCII)
+_FOLDING_RE = re.compile(rb"\r?\n(?=[ \t])", re.ASCII)
+
+
+def _find_date_header(msg_bytes: bytes) -> Optional[str]:
+    """Return the Date header of a raw message by scanning its header block,
+    without building the whole Message tree."""
+    # The header block ends at the first blank line, whichever line ending it uses
+    ends = [i for i in (msg_bytes.find(b"\r\n\r\n"), msg_bytes.find(b"\n\n")) if i >= 0]
+    end = min(ends) if ends else -1
+    headers = msg_bytes if end < 0 else msg_bytes[:end]
+
+    match = _DATE_HEADER_RE.search(headers)
+    if match:
+        return _FOLDING_RE.sub(b"", match.group(1)).decode("latin-1").strip()
+
+    # Unusual header layout, let the email package parse the headers only
+    return BytesHeaderParser().parsebytes(headers).get("Date")
+
+
+# Active batch_append of the current thread: (imap_client, folder, pending appends)
+_BATCH = threading.local()
+
+
 def save_to_sent_folder(
     imap_client: Union[imaplib.IMAP4, imaplib.IMAP4_SSL],
     sent_folder: str,
-    msg_bytes: bytes
+    msg_bytes: bytes,
+    msg: Optional[Message] = None
 ) -> bool:
-    """Save the sent email to the specified Sent folder."""
+    """Save the sent email to the specified Sent folder.
+    If the already built `msg` is given, its Date header is used without reparsing `msg_bytes`.
+    """
     folders = list_mailboxes(imap_client)
-    folder_names = [f["name"] for f in folders]
-    if sent_folder not in folder_names:
+    if not any(f["name"] == sent_folder for f in folders):
         logger.warning(f"Sent folder '{sent_folder}' does not exist. Attempting to create it.")
         try:
             imap_client.create(sent_folder)
             logger.info(f"Created Sent folder: {sent_folder}")
+            _FOLDER_CACHE.pop(imap_client, None)  # Folder list changed
         except Exception as e:
             logger.error(f"Failed to create Sent folder '{sent_folder}': {e}")
             return False
         
     try:
         # Try to get original date from the message for proper timestamping
-        msg = message_from_bytes(msg_bytes)
-        date_header = msg.get("Date")
+        if msg is not None:
+            date_header = msg.get("Date")
+        else:
+            date_header = _find_date_header(msg_bytes)
         if date_header:
-            time_tuple = parsedate_tz(date_header)
-            timestamp = mktime_tz(time_tuple)
-            internal_date = imaplib.Time2Internaldate(time.localtime(timestamp))
+            internal_date = _internaldate_from_header(date_header)
         else:
-            internal_date = imaplib.Time2Internaldate(time.time())
+            internal_date = _now_internaldate()
     except Exception as e:
         logger.warning(f"Failed to parse Date header for internal date: {e}")
-        internal_date = imaplib.Time2Internaldate(time.localtime())
+        internal_date = _now_internaldate()
 
 
+    batch = getattr(_BATCH, "current", None)
+    if batch is not None and batch[0] is imap_client and batch[1] == sent_folder:
+        # Inside batch_append for this client and folder, appended when the batch ends
+        # (True means queued, failures are reported by batch_append)
+        batch[2].append((internal_date, msg_bytes))
+        logger.debug(f"Email queued for the Sent folder: {sent_folder}")
+        return True
+
     try:
         imap_client.append(sent_folder, '\\Seen', internal_date, msg_bytes)
         logger.info(f"Email saved to Sent folder: {sent_folder}")
@@ -105,6 +274,98 @@ def save_to_sent_folder(
         return False
 
 
+class _LiteralFeeder:
+    """Feed successive literals to imaplib on each continuation request."""
+
+    def __init__(self, chunks: List[bytes]):
+        self._chunks = iter(chunks)
+
+    def next(self, continuation: bytes) -> bytes:
+        return next(self._chunks)
+
+
+def _multiappend(
+    imap_client: Union[imaplib.IMAP4, imaplib.IMAP4_SSL],
+    folder: str,
+    pending: List[Tuple[str, bytes]]
+) -> Tuple[str, list]:
+    """
+    Append several messages with a single APPEND command (MULTIAPPEND, RFC 3502).
+    imaplib only sends one literal per command, so the literals after the first one
+    are fed through its continuation callback, each followed by the next message's
+    flags, date and literal size.
+    """
+    literals = [imaplib.MapCRLF.sub(imaplib.CRLF, msg_bytes) for _, msg_bytes in pending]
+    chunks = []
+    for i, literal in enumerate(literals[:-1]):
+        next_date = pending[i + 1][0].encode("ascii")
+        chunks.append(literal + b" (\\Seen) " + next_date + b" {%d}" % len(literals[i + 1]))
+    chunks.append(literals[-1])
+
+    # imaplib treats a bound method as a literal generator, called on each continuation
+    imap_client.literal = _LiteralFeeder(chunks).next
+    return imap_client._simple_command("APPEND", folder, "(\\Seen)", pending[0][0], "{%d}" % len(literals[0]))
+
+
+def _flush_appends(
+    imap_client: Union[imaplib.IMAP4, imaplib.IMAP4_SSL],
+    folder: str,
+    pending: List[Tuple[str, bytes]]
+) -> int:
+    """Append the messages queued by batch_append, in one command when the server supports it.
+    Returns the number of messages that could not be saved.
+    """
+    if len(pending) > 1 and "MULTIAPPEND" in imap_client.capabilities and not imap_client.utf8_enabled:
+        try:
+            status, data = _multiappend(imap_client, folder, pending)
+            if status == "OK":
+                logger.info(f"{len(pending)} emails saved to Sent folder: {folder}")
+                return 0
+            logger.warning(f"MULTIAPPEND to Sent folder failed, appending one by one: {data}")
+        except Exception as e:
+            logger.warning(f"MULTIAPPEND to Sent folder failed, appending one by one: {e}")
+        # MULTIAPPEND is all-or-nothing (RFC 3502), nothing was saved so retrying is safe
+
+    failed = 0
+    for position, (internal_date, msg_bytes) in enumerate(pending, 1):
+        try:
+            status, data = imap_client.append(folder, '\\Seen', internal_date, msg_bytes)
+            if status != "OK":
+                raise imaplib.IMAP4.error(data)
+            logger.info(f"Email saved to Sent folder: {folder}")
+        except Exception as e:
+            logger.error(f"Failed to save queued email {position}/{len(pending)} to Sent folder: {e}")
+            failed += 1
+    return failed
+
+
+@contextmanager
+def batch_append(imap_client: Union[imaplib.IMAP4, imaplib.IMAP4_SSL], folder: str):
+    """
+    Queue the messages saved with save_to_sent_folder to `folder` on `imap_client`
+    and append them together when the block ends, with MULTIAPPEND if available.
+    Inside the block save_to_sent_folder only reports that the message was queued;
+    messages that cannot be saved when the batch is flushed are logged as errors.
+    """
+    pending: List[Tuple[str, bytes]] = []
+    previous = getattr(_BATCH, "current", None)
+    _BATCH.current = (imap_client, folder, pending)
+    try:
+        yield
+    finally:
+        _BATCH.current = previous
+        if pending:
+            failed = _flush_appends(imap_client, folder, pending)
+            if failed:
+                logger.error(f"{failed} of {len(pending)} sent emails could not be saved to Sent folder: {folder}")
+
+
+# ASCII only: \d must not match other Unicode digits, which int() would accept too
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII)
+_ISO_DATETIME_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2})(?::(\d{2}))?", re.ASCII)
+
+
+@lru_cache(maxsize=256)
 def parse_datetime_flexible(s: str) -> Optional[float]:
     """
     Parse a user-provided date/time string into a timestamp (seconds since epoch).
@@ -114,31 +375,33 @@ def parse_datetime_flexible(s: str) -> Optional[float]:
       - YYYY-MM-DDTHH:MM:SS
       - YYYY-MM-DD HH:MM[:SS]
       - Full ISO variations (if Python can parse)
-    Returns None if parsing fails.
+    Returns None if parsing fails. Results are cached, the same filter values recur within a run.
     """
     if not s:
         return None
     s = s.strip()
-    # Try fromisoformat (Python 3.7+)
+
+    # Fast path for the canonical formats, dispatched on length
+    length = len(s)
+    if length == 10:
+        match = _ISO_DATE_RE.fullmatch(s)
+    elif length in (16, 19):
+        match = _ISO_DATETIME_RE.fullmatch(s)
+    else:
+        match = None
+    if match:
+        try:
+            return datetime(*(int(g) for g in match.groups() if g is not None)).timestamp()
+        except ValueError:
+            return None  # Well-formed but out of range (e.g. month 13)
+
+    # Other ISO variations (timezone, microseconds, ...)
     try:
-        # Handle date-only -> set midnight
-        if "T" in s or "-" in s and (":" in s):
-            dt = datetime.fromisoformat(s)
-        elif re.fullmatch(r"\d{4}-\d{2}-\d{2}", s):
-            dt = datetime.fromisoformat(s)
-        else:
-            # Try common formats
-            for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M"):
-                dt = datetime.strptime(s, fmt)
-                break
-            else:
-                dt = None
-        if dt:
-            return dt.timestamp()
-    except Exception:
+        return datetime.fromisoformat(s).timestamp()
+    except ValueError:
         pass
 
-    # Fallback: try several strptime attempts
+    # Fallback: try several strptime attempts (e.g. non zero-padded values)
     for fmt in ("%Y-%m-%d", "%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S"):
         try:
             dt = datetime.strptime(s, fmt)
@@ -148,6 +411,59 @@ def parse_datetime_flexible(s: str) -> Optional[float]:
     return None
 
 
+# Base64 characters decoded per block when saving attachments, a multiple of 4
+_B64_BLOCK = 64 * 1024
+_B64_JUNK_RE = re.compile(r"[^A-Za-z0-9+/=]", re.ASCII)
+
+
+def save_part_payload(part: Message, path: str) -> None:
+    """
+    Write the decoded payload of a MIME part to `path`.
+    Base64 payloads are decoded and written in blocks instead of materializing
+    the whole decoded attachment in memory.
+    """
+    payload = part.get_payload()
+    if not isinstance(payload, str) or part.get("Content-Transfer-Encoding", "").strip().lower() != "base64":
+        with open(path, "wb") as f:
+            f.write(part.get_payload(decode=True))
+        return
+
+    try:
+        with open(path, "wb", buffering=1 << 20) as f:
+            pending = ""
+            for start in range(0, len(payload), _B64_BLOCK):
+                block = pending + _B64_JUNK_RE.sub("", payload[start:start + _B64_BLOCK])
+                usable = len(block) - len(block) % 4
+                f.write(binascii.a2b_base64(block[:usable]))
+                pending = block[usable:]
+            if pending:
+                f.write(binascii.a2b_base64(pending + "=" * (-len(pending) % 4)))
+    except (binascii.Error, ValueError):
+        # Malformed base64, rewrite it with the lenient decoding of the email package
+        with open(path, "wb") as f:
+            f.write(part.get_payload(decode=True))
+
+
+_BODY_TYPES = frozenset(("text/plain", "text/html"))
+
+
+def _text_parts(root: Message) -> Iterator[Tuple[str, Message]]:
+    """
+    Yield (content_type, part) for the text/plain and text/html parts of a message that are not attachments,
+    in the same order as msg.walk(), with an explicit stack instead of recursive generators.
+    """
+    stack = [root]
+    pop = stack.pop
+    while stack:
+        part = pop()
+        if part.is_multipart():
+            stack.extend(reversed(part.get_payload()))  # Reversed to pop them in order
+            continue
+        ctype = part.get_content_type()
+        if ctype in _BODY_TYPES and part.get_content_disposition() != "attachment":
+            yield ctype, part
+
+
 def extract_body_from_msg(msg: Message) -> List[Tuple[str, str]]:
     """
     Return all text/plain and text/html payloads from an email as a list of tuples:
@@ -155,28 +471,102 @@ def extract_body_from_msg(msg: Message) -> List[Tuple[str, str]]:
     Always decodes and ignores attachments.
     """
     bodies: List[Tuple[str, str]] = []
+    append = bodies.append
 
     if msg.is_multipart():
-        for part in msg.walk():
-            ctype = part.get_content_type()
-            dispo = part.get_content_disposition()
-            if ctype in ("text/plain", "text/html") and dispo != "attachment":
-                try:
-                    text = part.get_payload(decode=True).decode(part.get_content_charset() or "utf-8", errors="ignore")
-                    bodies.append((ctype, text))
-                except Exception:
-                    continue
+        for ctype, part in _text_parts(msg):
+            charset = part.get_content_charset() or "utf-8"
+            try:
+                append((ctype, part.get_payload(decode=True).decode(charset, "ignore")))
+            except Exception:
+                continue
     else:
         ctype = msg.get_content_type()
+        charset = msg.get_content_charset() or "utf-8"
         try:
-            text = msg.get_payload(decode=True).decode(msg.get_content_charset() or "utf-8", errors="ignore")
-            bodies.append((ctype, text))
+            append((ctype, msg.get_payload(decode=True).decode(charset, "ignore")))
         except Exception:
             pass
 
     return bodies
 
 
+# Wildcard characters understood by the server's filter_by query
+_PATTERN_CHARS = frozenset("*?")
+
+
+def _matches_from_response(addr: str, response) -> List[str]:
+    """Return the addresses matched by a wildcard address from the server response."""
+    if response.status_code == 200:
+        matches = response.json() or []
+        logger.info(f"Server returned {len(matches)} matches for address '{addr}': {matches}.")
+        logger.info(f"Address '{addr}' expanded to: {matches}.")
+        return matches
+    logger.error(f"Failed to expand address '{addr}': {response.json()}.")
+    return []
+
+
+def _query_address(server: str, port: int, addr: str) -> List[str]:
+    """Query the server for the addresses matching a wildcard address."""
+    try:
+        response = API_SESSION.get(
+            f"http://{server}:{port}/users?filter_by={addr}",
+            timeout=API_TIMEOUT
+        )
+        return _matches_from_response(addr, response)
+    except Exception as e:
+        logger.error(f"Error expanding address '{addr}': {e}.")
+    return []
+
+
+async def _query_addresses_async(server: str, port: int, patterns: List[str]) -> List[List[str]]:
+    """Query the server for several wildcard addresses at once from a single httpx client."""
+    async with httpx.AsyncClient(base_url=f"http://{server}:{port}", timeout=API_TIMEOUT) as client:
+        async def query(addr: str) -> List[str]:
+            try:
+                response = await client.get(f"/users?filter_by={addr}")
+                return _matches_from_response(addr, response)
+            except Exception as e:
+                logger.error(f"Error expanding address '{addr}': {e}.")
+            return []
+
+        return await asyncio.gather(*(query(addr) for addr in patterns))
+
+
+def _expand_patterns(server: str, port: int, addresses: List[str]) -> Dict[str, List[str]]:
+    """
+    Query the server once per unique wildcard address.
+    Queries run on an httpx event loop when httpx is installed, otherwise on threads
+    over a pooled session.
+    Returns a dict mapping each wildcard address to its matches.
+    """
+    # No wildcard characters, the address is used directly without asking the server
+    patterns = list(dict.fromkeys(addr for addr in addresses if not _PATTERN_CHARS.isdisjoint(addr)))
+    if not patterns:
+        return {}
+
+    if httpx is not None:
+        return dict(zip(patterns, asyncio.run(_query_addresses_async(server, port, patterns))))
+
+    with ThreadPoolExecutor(max_workers=min(32, len(patterns))) as executor:
+        results = executor.map(lambda addr: _query_address(server, port, addr), patterns)
+        return dict(zip(patterns, results))
+
+
+def _apply_expansion(addresses: List[str], matches_by_pattern: Dict[str, List[str]]) -> List[str]:
+    """Replace each wildcard address with its matches, without duplicates and in input order."""
+    expanded_addresses = []
+    seen = set()
+    for addr in addresses:
+        for match in matches_by_pattern.get(addr, (addr,)):
+            # Remove duplicates while expanding, keep order
+            if match not in seen:
+                seen.add(match)
+                expanded_addresses.append(match)
+
+    return expanded_addresses
+
+
 def expand_addresses(
     server: str,
     port: int,
@@ -184,32 +574,10 @@ def expand_addresses(
 ) -> List[str]:
     """
     Expand a list of addresses by querying the server for each address.
-    Returns a list of expanded addresses.
+    Addresses with wildcards are queried concurrently over a pooled session.
+    Returns a list of expanded addresses, without duplicates and in input order.
     """
-    expanded_addresses = []
-
-    for addr in addresses:
-        if '*' not in addr and '?' not in addr:
-            # No regex characters, add directly
-            expanded_addresses.append(addr)
-            continue
-
-        try:
-            response = requests.get(
-                f"http://{server}:{port}/users?filter_by={addr}"
-            )
-            if response.status_code == 200:
-                matches = response.json() or []
-                logger.info(f"Server returned {len(matches)} matches for address '{addr}': {matches}.")
-                expanded_addresses.extend(matches)
-                logger.info(f"Address '{addr}' expanded to: {matches}.")
-            else:
-                logger.error(f"Failed to expand address '{addr}': {response.json()}.")
-        except Exception as e:
-            logger.error(f"Error expanding address '{addr}': {e}.")
-
-    expanded_addresses = list(set(expanded_addresses))  # Remove duplicates
-    return expanded_addresses
+    return _apply_expansion(addresses, _expand_patterns(server, port, addresses))
 
 
 def expand_all_recipients(
@@ -221,11 +589,16 @@ def expand_all_recipients(
 ) -> Tuple[List[str], List[str], List[str]]:
     """
     Expand destination, cc, and bcc lists using regex patterns, querying the server for matching addresses.
+    A wildcard address repeated across the lists is only queried once.
     Returns three lists: (expanded_recipients, expanded_cc, expanded_bcc)
     """
-    expanded_destination = expand_addresses(server, port, destination)
-    expanded_cc = expand_addresses(server, port, cc or [])
-    expanded_bcc = expand_addresses(server, port, bcc or [])
+    cc = cc or []
+    bcc = bcc or []
+    matches_by_pattern = _expand_patterns(server, port, destination + cc + bcc)
+
+    expanded_destination = _apply_expansion(destination, matches_by_pattern)
+    expanded_cc = _apply_expansion(cc, matches_by_pattern)
+    expanded_bcc = _apply_expansion(bcc, matches_by_pattern)
 
     return expanded_destination, expanded_cc, expanded_bcc
 
@@ -12,34 +12,42 @@ def main():
     # --- SEND ---
     send_parser = subparsers.add_parser("send", help="Send an email.")
     send.register_arguments(send_parser)
+    send_parser.set_defaults(func=send.send_email_cli)
 
     # --- READ ---
     read_parser = subparsers.add_parser("read", help="Read emails.")
     read.register_arguments(read_parser)
+    read_parser.set_defaults(func=read.read_email_cli)
 
     # --- REPLY ---
     reply_parser = subparsers.add_parser("reply", help="Reply to emails.")
     reply.register_arguments(reply_parser)
+    reply_parser.set_defaults(func=reply.reply_email_cli)
 
     # --- FORWARD ---
     forward_parser = subparsers.add_parser("forward", help="Forward emails.")
     forward.register_arguments(forward_parser)
+    forward_parser.set_defaults(func=forward.forward_email_cli)
 
     # --- REGISTER ---
     register_parser = subparsers.add_parser("register", help="Register a new user.")
     register.register_arguments(register_parser)
+    register_parser.set_defaults(func=register.register_user_cli)
 
     # --- PASSWD ---
     passwd_parser = subparsers.add_parser("passwd", help="Change user password.")
     passwd.register_arguments(passwd_parser)
+    passwd_parser.set_defaults(func=passwd.passwd_cli)
 
     # --- DELETE ---
     delete_parser = subparsers.add_parser("delete", help="Delete a user.")
     delete.register_arguments(delete_parser)
+    delete_parser.set_defaults(func=delete.delete_cli)
 
     # --- THUNDERBIRD ---
     thunderbird_parser = subparsers.add_parser("thunderbird", help="Set up Thunderbird email client.")
     thunderbird.register_arguments(thunderbird_parser)
+    thunderbird_parser.set_defaults(func=thunderbird.thunderbird_cli)
 
     args, unknown = parser.parse_known_args()
 
@@ -52,25 +60,11 @@ def main():
         logger.warning(f"Unknown arguments ignored: {unknown}")
     logger.debug(f"Arguments: {args}")
 
-    if args.command == "send":
-        send.send_email_cli(args)
-    elif args.command == "read":
-        read.read_email_cli(args)
-    elif args.command == "reply":
-        reply.reply_email_cli(args)
-    elif args.command == "forward":
-        forward.forward_email_cli(args)
-    elif args.command == "register":
-        register.register_user_cli(args)
-    elif args.command == "passwd":
-        passwd.passwd_cli(args)
-    elif args.command == "delete":
-        delete.delete_cli(args)
-    elif args.command == "thunderbird":
-        thunderbird.thunderbird_cli(args)
-    else:
+    func = getattr(args, "func", None)
+    if func is None:
         parser.print_help()
         sys.exit(1)
+    func(args)
 
     logger.info("Finishing mailclient.")
 